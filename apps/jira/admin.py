@@ -265,6 +265,9 @@ class JiraProjectAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('jira_organization', 'product')
+    
     def product_display(self, obj):
         if obj.product:
             url = reverse('admin:products_product_change', args=[obj.product.pk])
@@ -1,13 +1,44 @@
 import requests
+from requests.adapters import HTTPAdapter
 import base64
 import json
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Authenticated sessions shared by every client for the same JIRA account, so
+# services built per request/batch reuse kept-alive connections
+_session_pool: Dict[Tuple[str, str, str], requests.Session] = {}
+_session_pool_lock = threading.Lock()
+
+
+def get_pooled_session(base_url: str, username: str, api_token: str) -> requests.Session:
+    """Get (or create) the shared authenticated session for a JIRA account"""
+    key = (base_url, username, api_token)
+    with _session_pool_lock:
+        session = _session_pool.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            
+            auth_string = f"{username}:{api_token}"
+            auth_bytes = auth_string.encode('ascii')
+            auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
+            
+            session.headers.update({
+                'Authorization': f'Basic {auth_b64}',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            })
+            _session_pool[key] = session
+        return session
+
 
 class JiraAPIClient:
     """Client for interacting with JIRA Cloud REST API"""
@@ -18,17 +49,8 @@ class JiraAPIClient:
         self.api_token = api_token
         self.api_base = f"{self.base_url}/rest/api/3"
         
-        # Create session with authentication
-        self.session = requests.Session()
-        auth_string = f"{username}:{api_token}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        self.session.headers.update({
-            'Authorization': f'Basic {auth_b64}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+        # Reuse the pooled session with authentication
+        self.session = get_pooled_session(self.base_url, username, api_token)
     
     def _make_request(self, endpoint: str, method: str = 'GET', params: dict = None, data: dict = None) -> Tuple[bool, dict]:
         """Make a request to JIRA API"""
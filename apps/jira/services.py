@@ -194,8 +194,8 @@ class JiraSyncService:
         
         return synced_count
     
-    def _sync_single_issue(self, project: JiraProject, issue_data: Dict) -> bool:
-        """Sync a single JIRA issue"""
+    def _sync_single_issue(self, project: JiraProject, issue_data: Dict) -> Optional[JiraIssue]:
+        """Sync a single JIRA issue, returning the saved JiraIssue (None on failure)"""
         try:
             # Extract basic issue information
             jira_key = issue_data.get('key', '')
@@ -203,7 +203,7 @@ class JiraSyncService:
             fields = issue_data.get('fields', {})
             
             if not jira_key or not jira_id:
-                return False
+                return None
             
             # Extract issue details
             summary = fields.get('summary', '')
@@ -277,11 +277,11 @@ class JiraSyncService:
             if created:
                 logger.debug(f"Created new JIRA issue: {issue}")
             
-            return True
+            return issue
             
         except Exception as e:
             logger.error(f"Error processing JIRA issue data: {str(e)}")
-            return False
+            return None
     
     def _update_project_statistics(self, project: JiraProject):
         """Update project issue statistics"""
@@ -368,10 +368,10 @@ class SentryJiraLinkService:
             
             # Create local JIRA issue record
             sync_service = JiraSyncService(jira_project.jira_organization)
-            sync_service._sync_single_issue(jira_project, issue_data)
+            jira_issue = sync_service._sync_single_issue(jira_project, issue_data)
+            if jira_issue is None:
+                return False, None, f"Created JIRA issue {jira_key} but failed to sync locally"
             
-            # Get the created JiraIssue object
-            jira_issue = JiraIssue.objects.get(jira_project=jira_project, jira_key=jira_key)
             jira_issue.created_from_sentry = True
             jira_issue.save()
             
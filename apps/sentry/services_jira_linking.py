@@ -292,7 +292,7 @@ class SentryJiraLinkingService:
     def _fetch_and_create_missing_jira_ticket(self, ticket_key: str, jira_ticket_info: Dict, 
                                             sentry_issue) -> Dict:
         """Fetch and create a missing JIRA ticket from the JIRA API"""
-        from apps.jira.models import JiraOrganization, JiraProject, JiraIssue
+        from apps.jira.models import JiraOrganization, JiraProject
         from apps.jira.services import JiraSyncService
         from apps.jira.client import JiraAPIClient
         
@@ -364,21 +364,12 @@ class SentryJiraLinkingService:
             
             # Create the JIRA issue using the sync service
             sync_service = JiraSyncService(jira_org)
-            created_issue = sync_service._sync_single_issue(jira_project, issue_data)
+            jira_issue = sync_service._sync_single_issue(jira_project, issue_data)
             
-            if created_issue:
-                # Get the created issue
-                jira_issue = JiraIssue.objects.filter(
-                    jira_project=jira_project,
-                    jira_key=ticket_key
-                ).first()
-                
-                if jira_issue:
-                    result['success'] = True
-                    result['jira_issue'] = jira_issue
-                    logger.info(f"Successfully fetched and created JIRA issue {ticket_key}")
-                else:
-                    result['error'] = "Issue created but not found in database"
+            if jira_issue:
+                result['success'] = True
+                result['jira_issue'] = jira_issue
+                logger.info(f"Successfully fetched and created JIRA issue {ticket_key}")
             else:
                 result['error'] = "Failed to create JIRA issue in database"
             
@@ -382,9 +382,10 @@ class SonarCloudProjectAdmin(admin.ModelAdmin):
         synced_count = 0
         for project in queryset.filter(sync_enabled=True):
             try:
-                from .services import SonarCloudSyncService
+                from .services import SonarCloudSyncService, copy_create_measurements
                 service = SonarCloudSyncService(project.sonarcloud_organization)
                 service._sync_project_measures(project)
+                copy_create_measurements(service.measurement_buf)
                 synced_count += 1
             except Exception as e:
                 self.message_user(request, f'Failed to sync {project.project_key}: {str(e)}', level='ERROR')
@@ -769,26 +770,28 @@ class JiraSonarLinkAdmin(admin.ModelAdmin):
     automation_status.short_description = 'Automation'
     
     def process_automated_tickets(self, request, queryset):
-        from .services_integration import JiraQualityService
-        service = JiraQualityService()
+        from .tasks import process_automated_ticket_creation
         
+        links = {link.id: link for link in queryset}
         total_tickets = 0
-        for link in queryset:
-            try:
-                results = service.process_automated_ticket_creation(link)
-                tickets_created = (
-                    results['security_tickets'] + 
-                    results['debt_tickets'] + 
-                    results['coverage_tickets']
-                )
-                total_tickets += tickets_created
-                
-                if results['errors']:
-                    for error in results['errors']:
-                        self.message_user(request, f'{link}: {error}', level='WARNING')
-                        
-            except Exception as e:
-                self.message_user(request, f'Failed to process {link}: {str(e)}', level='ERROR')
+        try:
+            all_results = process_automated_ticket_creation(list(links))
+        except Exception as e:
+            self.message_user(request, f'Failed to process links: {str(e)}', level='ERROR')
+            return
+        
+        for results in all_results:
+            link = links[results['link_id']]
+            tickets_created = (
+                results['security_tickets'] + 
+                results['debt_tickets'] + 
+                results['coverage_tickets']
+            )
+            total_tickets += tickets_created
+            
+            if results['errors']:
+                for error in results['errors']:
+                    self.message_user(request, f'{link}: {error}', level='WARNING')
         
         self.message_user(request, f'Successfully created {total_tickets} automated tickets.')
     process_automated_tickets.short_description = 'Process automated ticket creation'
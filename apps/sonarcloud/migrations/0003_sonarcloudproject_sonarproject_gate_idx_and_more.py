@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sonarcloud", "0002_jirasonarlink_qualityissueticket_sentrysonarlink"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sonarcloudproject",
+            index=models.Index(
+                fields=["quality_gate_status"], name="sonarproject_gate_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="codeissue",
+            index=models.Index(
+                fields=["type", "severity", "status"], name="codeissue_tss_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="codeissue",
+            index=models.Index(
+                fields=["project", "status"], name="codeissue_project_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="codeissue",
+            index=models.Index(
+                condition=models.Q(("status", "OPEN")),
+                fields=["project"],
+                name="codeissue_open_by_proj",
+            ),
+        ),
+    ]
@@ -7,6 +7,23 @@ import json
 User = get_user_model()
 
 
+# Convert A=100, B=80, C=60, D=40, E=20
+RATING_SCORES = {'A': 100, 'B': 80, 'C': 60, 'D': 40, 'E': 20}
+
+
+def quality_score_from_ratings(*ratings):
+    """Average the 0-100 scores of the given A-E ratings, ignoring blanks"""
+    scores = [RATING_SCORES[r] for r in ratings if r in RATING_SCORES]
+    if not scores:
+        return None
+    return sum(scores) / len(scores)
+
+
+def sonarcloud_project_url(project_key):
+    """Get the SonarCloud overview URL for a project key"""
+    return f"https://sonarcloud.io/project/overview?id={project_key}"
+
+
 class SonarCloudOrganization(models.Model):
     """Represents a SonarCloud organization"""
     name = models.CharField(max_length=200, help_text="Display name for this SonarCloud organization")
@@ -130,6 +147,9 @@ class SonarCloudProject(models.Model):
         verbose_name_plural = 'SonarCloud Projects'
         unique_together = ['sonarcloud_organization', 'project_key']
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['quality_gate_status'], name='sonarproject_gate_idx'),
+        ]
     
     def __str__(self):
         return f"{self.project_key} - {self.name}"
@@ -137,22 +157,14 @@ class SonarCloudProject(models.Model):
     @property
     def sonarcloud_url(self):
         """Get the SonarCloud project URL"""
-        org_key = self.sonarcloud_organization.organization_key
-        return f"https://sonarcloud.io/project/overview?id={self.project_key}"
+        return sonarcloud_project_url(self.project_key)
     
     @property
     def overall_quality_score(self):
         """Calculate an overall quality score (0-100)"""
-        ratings = [self.reliability_rating, self.security_rating, self.maintainability_rating]
-        valid_ratings = [r for r in ratings if r and r in 'ABCDE']
-        
-        if not valid_ratings:
-            return None
-        
-        # Convert A=100, B=80, C=60, D=40, E=20
-        rating_scores = {'A': 100, 'B': 80, 'C': 60, 'D': 40, 'E': 20}
-        scores = [rating_scores[r] for r in valid_ratings]
-        return sum(scores) / len(scores)
+        return quality_score_from_ratings(
+            self.reliability_rating, self.security_rating, self.maintainability_rating
+        )
     
     @property
     def quality_status_color(self):
@@ -262,6 +274,13 @@ class CodeIssue(models.Model):
         verbose_name = 'Code Issue'
         verbose_name_plural = 'Code Issues'
         ordering = ['-creation_date']
+        indexes = [
+            models.Index(fields=['type', 'severity', 'status'], name='codeissue_tss_idx'),
+            models.Index(fields=['project', 'status'], name='codeissue_project_status_idx'),
+            models.Index(
+                fields=['project'], condition=models.Q(status='OPEN'), name='codeissue_open_by_proj'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.sonarcloud_key} - {self.message[:50]}"
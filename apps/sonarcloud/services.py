@@ -1,8 +1,11 @@
+import csv
+import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from django.utils import timezone as django_timezone
-from django.db import transaction
+from django.db import connection, transaction
 
 from .models import (
     SonarCloudOrganization, SonarCloudProject, QualityMeasurement,
@@ -15,6 +18,58 @@ from .client import (
 
 logger = logging.getLogger(__name__)
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _row_update_date(row: Dict) -> datetime:
+    """Last update time of an issue/hotspot payload (EPOCH when missing)"""
+    update_date = row.get('updateDate')
+    return parse_sonar_datetime(update_date) if update_date else EPOCH
+
+
+def copy_create_measurements(measurements: List[QualityMeasurement]) -> int:
+    """Insert QualityMeasurement rows in a single round trip.
+
+    On PostgreSQL the rows are streamed with COPY ... FROM STDIN; other
+    backends (and COPY failures such as duplicate analyses) fall back to
+    bulk_create.
+    """
+    if not measurements:
+        return 0
+    
+    if connection.vendor != 'postgresql':
+        QualityMeasurement.objects.bulk_create(measurements, ignore_conflicts=True)
+        return len(measurements)
+    
+    now = django_timezone.now()
+    fields = [f for f in QualityMeasurement._meta.concrete_fields if not f.primary_key]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for measurement in measurements:
+        if measurement.created_at is None:
+            measurement.created_at = now
+        row = []
+        for field in fields:
+            value = field.get_db_prep_value(getattr(measurement, field.attname), connection)
+            row.append('\\N' if value is None else value)
+        writer.writerow(row)
+    buffer.seek(0)
+    
+    columns = ', '.join(connection.ops.quote_name(f.column) for f in fields)
+    sql = (
+        f"COPY {connection.ops.quote_name(QualityMeasurement._meta.db_table)} ({columns}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    try:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.copy_expert(sql, buffer)
+    except Exception as e:
+        logger.warning(f"COPY of quality measurements failed, falling back to bulk_create: {str(e)}")
+        QualityMeasurement.objects.bulk_create(measurements, ignore_conflicts=True)
+    
+    return len(measurements)
+
 
 class SonarCloudSyncService:
     """Service for syncing data from SonarCloud API"""
@@ -23,6 +78,14 @@ class SonarCloudSyncService:
         self.organization = sonarcloud_organization
         self.client = SonarCloudAPIClient(api_token=sonarcloud_organization.api_token)
         self.sync_log = None
+        # Projects whose latest SonarCloud analysis is already stored locally
+        self.unchanged_project_ids = set()
+        # New analysis dates, recorded only once the project's issues are stored too
+        self.pending_analysis_dates = {}
+        # Projects whose issue or hotspot fetch failed during this sync
+        self.failed_issue_project_ids = set()
+        # Historical measurements are buffered and written in one COPY at the end
+        self.measurement_buf = []
     
     def sync_all(self) -> SonarSyncLog:
         """Sync all data for the SonarCloud organization"""
@@ -34,37 +97,54 @@ class SonarCloudSyncService:
         )
         
         try:
+            # Test connection first
+            self._test_connection()
+            
+            # Sync projects
             with transaction.atomic():
-                # Test connection first
-                self._test_connection()
-                
-                # Sync projects
                 projects_count = self._sync_projects()
-                
-                # Sync measures for each enabled project
-                measures_count = 0
-                issues_count = 0
-                
+            
+            # Sync measures for each enabled project. Each project is committed
+            # on its own so one failure does not roll back the others and row
+            # locks are held only briefly.
+            measures_count = 0
+            issues_count = 0
+            
+            try:
                 for project in self.organization.projects.filter(sync_enabled=True):
-                    if project.sync_measures:
-                        if self._sync_project_measures(project):
-                            measures_count += 1
-                    
-                    if project.sync_issues:
-                        project_issues = self._sync_project_issues(project)
-                        issues_count += project_issues
-                
-                # Update sync log
-                self.sync_log.projects_synced = projects_count
-                self.sync_log.measures_synced = measures_count
-                self.sync_log.issues_synced = issues_count
-                self.sync_log.status = SonarSyncLog.Status.SUCCESS
-                
-                # Update organization last sync
-                self.organization.last_sync = django_timezone.now()
-                self.organization.connection_status = 'connected'
-                self.organization.save()
-                
+                    with transaction.atomic():
+                        if project.sync_measures:
+                            if self._sync_project_measures(project):
+                                measures_count += 1
+                        
+                        # Issues only change when a new analysis is published
+                        if project.sync_issues and project.id not in self.unchanged_project_ids:
+                            project_issues = self._sync_project_issues(project)
+                            issues_count += project_issues
+                        
+                        # A failed issue fetch leaves last_analysis untouched so
+                        # the next sync does not skip the project as unchanged
+                        analysis_date = self.pending_analysis_dates.pop(project.id, None)
+                        if analysis_date and project.id not in self.failed_issue_project_ids:
+                            project.last_analysis = analysis_date
+                            project.save(update_fields=['last_analysis'])
+            finally:
+                # Projects committed above must keep their history rows even if
+                # a later project fails
+                copy_create_measurements(self.measurement_buf)
+                self.measurement_buf = []
+            
+            # Update sync log
+            self.sync_log.projects_synced = projects_count
+            self.sync_log.measures_synced = measures_count
+            self.sync_log.issues_synced = issues_count
+            self.sync_log.status = SonarSyncLog.Status.SUCCESS
+            
+            # Update organization last sync
+            self.organization.last_sync = django_timezone.now()
+            self.organization.connection_status = 'connected'
+            self.organization.save()
+            
         except Exception as e:
             logger.error(f"SonarCloud sync failed for organization {self.organization.name}: {str(e)}")
             self.sync_log.status = SonarSyncLog.Status.FAILED
@@ -87,17 +167,19 @@ class SonarCloudSyncService:
     def _test_connection(self):
         """Test SonarCloud API connection"""
         success, message = self.client.test_connection()
-        self.organization.last_connection_test = django_timezone.now()
         
-        if success:
-            self.organization.connection_status = 'connected'
-            self.organization.connection_error = ''
-        else:
-            self.organization.connection_status = 'failed'
-            self.organization.connection_error = message
-            raise Exception(f"SonarCloud connection failed: {message}")
+        # Write only the connection columns and mirror them on the instance
+        fields = {
+            'last_connection_test': django_timezone.now(),
+            'connection_status': 'connected' if success else 'failed',
+            'connection_error': '' if success else message,
+        }
+        SonarCloudOrganization.objects.filter(pk=self.organization.pk).update(**fields)
+        for field, value in fields.items():
+            setattr(self.organization, field, value)
         
-        self.organization.save()
+        if not success:
+            raise Exception(f"SonarCloud connection failed: {message}")
     
     def _sync_projects(self) -> int:
         """Sync projects for the organization"""
@@ -153,6 +235,13 @@ class SonarCloudSyncService:
             measures = measures_data.get('measures', {})
             component = measures_data.get('component', {})
             
+            # Skip projects that have not been re-analysed since the last sync
+            last_analysis = component.get('analysisDate')
+            analysis_date = parse_sonar_datetime(last_analysis) if last_analysis else None
+            if analysis_date and project.last_analysis == analysis_date:
+                self.unchanged_project_ids.add(project.id)
+                return False
+            
             # Update project with latest measures
             project.quality_gate_status = measures.get('alert_status', 'NONE')
             
@@ -173,18 +262,17 @@ class SonarCloudSyncService:
             project.security_hotspots = int(float(measures.get('security_hotspots', 0)))
             project.code_smells = int(float(measures.get('code_smells', 0)))
             
-            # Get last analysis date if available
-            last_analysis = component.get('analysisDate')
-            if last_analysis:
-                project.last_analysis = parse_sonar_datetime(last_analysis)
+            # The analysis date is saved by sync_all once the issues are stored
+            if analysis_date:
+                self.pending_analysis_dates[project.id] = analysis_date
             
             project.last_measure_sync = django_timezone.now()
             project.save()
             
-            # Create historical measurement record
-            QualityMeasurement.objects.create(
+            # Buffer historical measurement record
+            self.measurement_buf.append(QualityMeasurement(
                 project=project,
-                analysis_date=project.last_analysis or django_timezone.now(),
+                analysis_date=analysis_date or project.last_analysis or django_timezone.now(),
                 quality_gate_status=project.quality_gate_status,
                 reliability_rating=project.reliability_rating,
                 security_rating=project.security_rating,
@@ -201,7 +289,7 @@ class SonarCloudSyncService:
                 cognitive_complexity=int(float(measures.get('cognitive_complexity', 0))),
                 classes=int(float(measures.get('classes', 0))),
                 functions=int(float(measures.get('functions', 0))),
-            )
+            ))
             
             return True
             
@@ -216,25 +304,37 @@ class SonarCloudSyncService:
         try:
             # Get regular issues (bugs, vulnerabilities, code smells)
             success, issues_data = self.client.get_project_issues(project.project_key)
-            if success:
-                for issue_data in issues_data:
-                    try:
-                        if self._sync_single_issue(project, issue_data):
-                            synced_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to sync issue {issue_data.get('key')}: {str(e)}")
+            if not success:
+                self.failed_issue_project_ids.add(project.id)
+                issues_data = []
             
             # Get security hotspots
             success, hotspots_data = self.client.get_security_hotspots(project.project_key)
-            if success:
-                for hotspot_data in hotspots_data:
-                    try:
-                        if self._sync_single_hotspot(project, hotspot_data):
-                            synced_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to sync hotspot {hotspot_data.get('key')}: {str(e)}")
+            if not success:
+                self.failed_issue_project_ids.add(project.id)
+                hotspots_data = []
+            
+            # The same key can appear in both responses; upsert each key once,
+            # keeping the most recently updated payload
+            unique_rows = {}
+            for sync_row, rows in ((self._sync_single_issue, issues_data),
+                                   (self._sync_single_hotspot, hotspots_data)):
+                for row in rows:
+                    key = row.get('key')
+                    if not key:
+                        continue
+                    updated = _row_update_date(row)
+                    previous = unique_rows.get(key)
+                    if previous is None or updated > previous[0]:
+                        unique_rows[key] = (updated, sync_row, row)
+            
+            # _sync_single_issue/_sync_single_hotspot handle their own errors per row
+            for _, sync_row, row in unique_rows.values():
+                if sync_row(project, row):
+                    synced_count += 1
             
         except Exception as e:
+            self.failed_issue_project_ids.add(project.id)
             logger.error(f"Error syncing issues for project {project.project_key}: {str(e)}")
         
         return synced_count
@@ -290,12 +390,12 @@ class SonarCloudSyncService:
             )
             
             if created:
-                logger.debug(f"Created new code issue: {issue}")
+                logger.debug("Created new code issue: %s", sonarcloud_key)
             
             return True
             
         except Exception as e:
-            logger.error(f"Error processing issue data: {str(e)}")
+            logger.error(f"Error processing issue {issue_data.get('key')}: {str(e)}")
             return False
     
     def _sync_single_hotspot(self, project: SonarCloudProject, hotspot_data: Dict) -> bool:
@@ -343,12 +443,12 @@ class SonarCloudSyncService:
             )
             
             if created:
-                logger.debug(f"Created new security hotspot: {issue}")
+                logger.debug("Created new security hotspot: %s", sonarcloud_key)
             
             return True
             
         except Exception as e:
-            logger.error(f"Error processing hotspot data: {str(e)}")
+            logger.error(f"Error processing hotspot {hotspot_data.get('key')}: {str(e)}")
             return False
 
 
@@ -364,17 +464,31 @@ def sync_sonarcloud_organization(organization_id: int) -> SonarSyncLog:
         return None
 
 
-def sync_all_sonarcloud_organizations() -> List[SonarSyncLog]:
-    """Sync all enabled SonarCloud organizations"""
-    sync_logs = []
-    organizations = SonarCloudOrganization.objects.filter(sync_enabled=True)
+def _sync_organization_in_thread(org: SonarCloudOrganization) -> Optional[SonarSyncLog]:
+    """Sync one organization from a worker thread, releasing its DB connection afterwards"""
+    try:
+        service = SonarCloudSyncService(org)
+        return service.sync_all()
+    except Exception as e:
+        logger.error(f"Failed to sync SonarCloud organization {org.name}: {str(e)}")
+        return None
+    finally:
+        # Each worker thread opens its own connection; close it so it is not leaked
+        connection.close()
+
+
+def sync_all_sonarcloud_organizations(max_workers: int = 8) -> List[SonarSyncLog]:
+    """Sync all enabled SonarCloud organizations
+
+    Each organization has its own API token (and rate limit) and writes to its
+    own rows, so organizations are synced concurrently.
+    """
+    organizations = list(SonarCloudOrganization.objects.filter(sync_enabled=True))
+    if not organizations:
+        return []
     
-    for org in organizations:
-        try:
-            service = SonarCloudSyncService(org)
-            sync_log = service.sync_all()
-            sync_logs.append(sync_log)
-        except Exception as e:
-            logger.error(f"Failed to sync SonarCloud organization {org.name}: {str(e)}")
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(organizations))) as executor:
+        results = executor.map(_sync_organization_in_thread, organizations)
+        sync_logs = [sync_log for sync_log in results if sync_log is not None]
     
-    return sync_logs
\ No newline at end of file
+    return sync_logs
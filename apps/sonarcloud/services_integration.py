@@ -1,15 +1,47 @@
 import logging
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple
 from django.utils import timezone as django_timezone
-from django.db import transaction
+from django.db.models import Count, Exists, Max, OuterRef, Sum
+from django.core.cache import cache
 
 from .models import (
     SonarCloudProject, CodeIssue, SentrySonarLink, 
-    JiraSonarLink, QualityIssueTicket
+    JiraSonarLink, QualityIssueTicket, quality_score_from_ratings,
+    sonarcloud_project_url
 )
 
 logger = logging.getLogger(__name__)
 
+# Severities at or above each threshold (Severity choices are ordered most to least severe)
+SEVERITY_AT_OR_ABOVE = {
+    severity: CodeIssue.Severity.values[:index + 1]
+    for index, severity in enumerate(CodeIssue.Severity.values)
+}
+
+# JIRA summary prefix per SonarCloud issue type
+TICKET_TYPE_PREFIXES = {
+    'BUG': '[Bug]',
+    'VULNERABILITY': '[Security]',
+    'SECURITY_HOTSPOT': '[Security Hotspot]',
+    'CODE_SMELL': '[Code Quality]'
+}
+
+# Tickets created in JIRA are linked locally after this many, bounding how many
+# remote tickets a crash can leave without a QualityIssueTicket row
+TICKET_LINK_BATCH_SIZE = 50
+
+# Lower bound of each grade above F; GRADES[i] applies from GRADE_THRESHOLDS[i - 1]
+GRADE_THRESHOLDS = (60, 65, 70, 75, 80, 85, 90, 95)
+GRADES = ('F', 'D', 'D+', 'C', 'C+', 'B', 'B+', 'A', 'A+')
+
+# SonarCloudProject columns needed to build a release quality context
+QUALITY_CONTEXT_FIELDS = (
+    'project_key', 'quality_gate_status', 'reliability_rating', 'security_rating',
+    'maintainability_rating', 'coverage', 'technical_debt', 'bugs', 'vulnerabilities',
+    'security_hotspots', 'code_smells', 'last_analysis',
+)
+
 
 class SentryQualityService:
     """Service for integrating SonarCloud quality data with Sentry"""
@@ -25,7 +57,7 @@ class SentryQualityService:
             existing_link = SentrySonarLink.objects.filter(
                 sentry_project=sentry_project,
                 sonarcloud_project=sonarcloud_project
-            ).first()
+            ).select_related('sentry_project', 'sonarcloud_project').first()
             
             if existing_link:
                 return False, existing_link, "Link already exists"
@@ -50,7 +82,7 @@ class SentryQualityService:
             # Get the SonarCloud link
             link = SentrySonarLink.objects.filter(
                 sentry_project=sentry_project
-            ).first()
+            ).select_related('sonarcloud_project').first()
             
             if not link:
                 return {'status': 'no_link', 'message': 'No SonarCloud project linked'}
@@ -64,30 +96,37 @@ class SentryQualityService:
     def get_quality_context_for_release(self, sentry_project) -> Dict:
         """Get quality context data for a Sentry release"""
         try:
-            link = SentrySonarLink.objects.filter(
+            # Read the linked project's columns straight into a dict
+            row = SentrySonarLink.objects.filter(
                 sentry_project=sentry_project
-            ).select_related('sonarcloud_project').first()
+            ).values(
+                *(f'sonarcloud_project__{field}' for field in QUALITY_CONTEXT_FIELDS)
+            ).first()
             
-            if not link:
+            if not row:
                 return {'has_quality_data': False}
             
-            project = link.sonarcloud_project
+            project = {field: row[f'sonarcloud_project__{field}'] for field in QUALITY_CONTEXT_FIELDS}
             
             return {
                 'has_quality_data': True,
-                'quality_gate_status': project.quality_gate_status,
-                'reliability_rating': project.reliability_rating,
-                'security_rating': project.security_rating,
-                'maintainability_rating': project.maintainability_rating,
-                'coverage': project.coverage,
-                'technical_debt_minutes': project.technical_debt,
-                'bugs': project.bugs,
-                'vulnerabilities': project.vulnerabilities,
-                'security_hotspots': project.security_hotspots,
-                'code_smells': project.code_smells,
-                'sonarcloud_url': project.sonarcloud_url,
-                'last_analysis': project.last_analysis,
-                'quality_score': project.overall_quality_score,
+                'quality_gate_status': project['quality_gate_status'],
+                'reliability_rating': project['reliability_rating'],
+                'security_rating': project['security_rating'],
+                'maintainability_rating': project['maintainability_rating'],
+                'coverage': project['coverage'],
+                'technical_debt_minutes': project['technical_debt'],
+                'bugs': project['bugs'],
+                'vulnerabilities': project['vulnerabilities'],
+                'security_hotspots': project['security_hotspots'],
+                'code_smells': project['code_smells'],
+                'sonarcloud_url': sonarcloud_project_url(project['project_key']),
+                'last_analysis': project['last_analysis'],
+                'quality_score': quality_score_from_ratings(
+                    project['reliability_rating'],
+                    project['security_rating'],
+                    project['maintainability_rating'],
+                ),
             }
             
         except Exception as e:
@@ -109,7 +148,7 @@ class JiraQualityService:
             existing_link = JiraSonarLink.objects.filter(
                 jira_project=jira_project,
                 sonarcloud_project=sonarcloud_project
-            ).first()
+            ).select_related('jira_project', 'sonarcloud_project').first()
             
             if existing_link:
                 return False, existing_link, "Link already exists"
@@ -130,17 +169,27 @@ class JiraQualityService:
     
     def create_jira_ticket_from_quality_issue(self, sonarcloud_issue: CodeIssue, 
                                             jira_sonar_link: JiraSonarLink,
-                                            creation_reason: str = 'manual') -> Tuple[bool, str]:
-        """Create a JIRA ticket from a SonarCloud quality issue"""
+                                            creation_reason: str = 'manual',
+                                            jira_service=None, sync_service=None,
+                                            check_existing: bool = True,
+                                            pending_tickets: Optional[List] = None) -> Tuple[bool, str]:
+        """Create a JIRA ticket from a SonarCloud quality issue
+        
+        Batch callers can pass already-built JIRA services, set
+        check_existing=False when they have filtered out ticketed issues, and
+        pass a pending_tickets list to defer the QualityIssueTicket insert to
+        _link_pending_tickets.
+        """
         try:
             # Check if ticket already exists
-            existing_ticket = QualityIssueTicket.objects.filter(
-                sonarcloud_issue=sonarcloud_issue,
-                jira_sonar_link=jira_sonar_link
-            ).first()
-            
-            if existing_ticket:
-                return False, f"Ticket already exists: {existing_ticket.jira_issue.jira_key}"
+            if check_existing:
+                existing_key = QualityIssueTicket.objects.filter(
+                    sonarcloud_issue=sonarcloud_issue,
+                    jira_sonar_link=jira_sonar_link
+                ).values_list('jira_issue__jira_key', flat=True).first()
+                
+                if existing_key:
+                    return False, f"Ticket already exists: {existing_key}"
             
             # Build ticket content based on issue type
             summary = self._build_ticket_summary(sonarcloud_issue)
@@ -162,8 +211,9 @@ class JiraQualityService:
             ]
             
             # Create JIRA ticket
-            from apps.jira.services import SentryJiraLinkService
-            jira_service = SentryJiraLinkService(jira_sonar_link.jira_project.jira_organization)
+            if jira_service is None:
+                from apps.jira.services import SentryJiraLinkService
+                jira_service = SentryJiraLinkService(jira_sonar_link.jira_project.jira_organization)
             
             success, jira_response = jira_service.client.create_issue(
                 project_key=jira_sonar_link.jira_project.jira_key,
@@ -181,19 +231,19 @@ class JiraQualityService:
             jira_key = jira_response.get('key')
             
             # Fetch the issue details and create local record
-            from apps.jira.services import JiraSyncService
-            sync_service = JiraSyncService(jira_sonar_link.jira_project.jira_organization)
+            if sync_service is None:
+                from apps.jira.services import JiraSyncService
+                sync_service = JiraSyncService(jira_sonar_link.jira_project.jira_organization)
             success, issue_data = sync_service.client.get_issue(jira_key)
             
             if success:
-                sync_service._sync_single_issue(jira_sonar_link.jira_project, issue_data)
+                jira_issue = sync_service._sync_single_issue(jira_sonar_link.jira_project, issue_data)
+                if jira_issue is None:
+                    return False, f"Created JIRA ticket {jira_key} but sync returned no object"
                 
-                # Get the created JiraIssue object
-                from apps.jira.models import JiraIssue
-                jira_issue = JiraIssue.objects.get(
-                    jira_project=jira_sonar_link.jira_project,
-                    jira_key=jira_key
-                )
+                if pending_tickets is not None:
+                    pending_tickets.append((sonarcloud_issue, jira_issue, creation_reason))
+                    return True, f"Successfully created JIRA ticket {jira_key}"
                 
                 # Create the quality issue ticket link
                 QualityIssueTicket.objects.create(
@@ -212,43 +262,50 @@ class JiraQualityService:
             logger.error(f"Error creating JIRA ticket from quality issue: {str(e)}")
             return False, str(e)
     
+    def _link_pending_tickets(self, jira_sonar_link: JiraSonarLink, pending_tickets: List) -> int:
+        """Create QualityIssueTicket rows for tickets deferred by the batch path and clear the list"""
+        if not pending_tickets:
+            return 0
+        
+        tickets = [
+            QualityIssueTicket(
+                sonarcloud_issue=sonarcloud_issue,
+                jira_issue=jira_issue,
+                jira_sonar_link=jira_sonar_link,
+                creation_reason=creation_reason,
+                auto_created=(creation_reason != 'manual')
+            )
+            for sonarcloud_issue, jira_issue, creation_reason in pending_tickets
+        ]
+        QualityIssueTicket.objects.bulk_create(tickets, ignore_conflicts=True)
+        pending_tickets.clear()
+        return len(tickets)
+    
     def _build_ticket_summary(self, issue: CodeIssue) -> str:
         """Build JIRA ticket summary from SonarCloud issue"""
-        type_prefix = {
-            'BUG': '[Bug]',
-            'VULNERABILITY': '[Security]',
-            'SECURITY_HOTSPOT': '[Security Hotspot]',
-            'CODE_SMELL': '[Code Quality]'
-        }.get(issue.type, '[Quality]')
-        
+        type_prefix = TICKET_TYPE_PREFIXES.get(issue.type, '[Quality]')
         return f"{type_prefix} {issue.message[:80]}"
     
     def _build_ticket_description(self, issue: CodeIssue) -> str:
         """Build JIRA ticket description from SonarCloud issue"""
-        description_parts = [
+        project = issue.project
+        description_parts = (
             f"SonarCloud Issue: {issue.message}",
             f"Type: {issue.get_type_display()}",
             f"Severity: {issue.get_severity_display()}",
             f"Rule: {issue.rule}",
             "",
             f"File: {issue.component}",
-        ]
-        
-        if issue.line:
-            description_parts.append(f"Line: {issue.line}")
-        
-        if issue.effort:
-            description_parts.append(f"Effort to Fix: {issue.effort}")
-        
-        description_parts.extend([
+            f"Line: {issue.line}" if issue.line else None,
+            f"Effort to Fix: {issue.effort}" if issue.effort else None,
             "",
-            f"SonarCloud Project: {issue.project.name}",
-            f"SonarCloud URL: {issue.project.sonarcloud_url}",
+            f"SonarCloud Project: {project.name}",
+            f"SonarCloud URL: {project.sonarcloud_url}",
             "",
-            "This ticket was automatically created from a SonarCloud quality issue."
-        ])
+            "This ticket was automatically created from a SonarCloud quality issue.",
+        )
         
-        return "\n".join(description_parts)
+        return "\n".join(part for part in description_parts if part is not None)
     
     def process_automated_ticket_creation(self, jira_sonar_link: JiraSonarLink) -> Dict:
         """Process automated ticket creation based on link settings"""
@@ -262,44 +319,66 @@ class JiraQualityService:
         try:
             project = jira_sonar_link.sonarcloud_project
             
-            # Create security tickets
-            if jira_sonar_link.auto_create_security_tickets:
-                security_issues = project.issues.filter(
-                    type__in=['VULNERABILITY', 'SECURITY_HOTSPOT'],
-                    severity__in=['BLOCKER', 'CRITICAL', 'MAJOR', 'MINOR'][:CodeIssue.Severity.choices.index((jira_sonar_link.security_severity_threshold, '')) + 1],
-                    status='OPEN'
-                ).exclude(
-                    jira_tickets__jira_sonar_link=jira_sonar_link
+            # Already-ticketed issues are excluded with an anti-join subquery,
+            # and the JIRA services are built once for the whole batch
+            has_ticket = Exists(
+                QualityIssueTicket.objects.filter(
+                    jira_sonar_link=jira_sonar_link,
+                    sonarcloud_issue=OuterRef('pk')
                 )
+            )
+            from apps.jira.services import SentryJiraLinkService, JiraSyncService
+            jira_organization = jira_sonar_link.jira_project.jira_organization
+            pending_tickets = []
+            ticket_kwargs = {
+                'jira_service': SentryJiraLinkService(jira_organization),
+                'sync_service': JiraSyncService(jira_organization),
+                'check_existing': False,
+                'pending_tickets': pending_tickets,
+            }
+            
+            try:
+                # Create security tickets
+                if jira_sonar_link.auto_create_security_tickets:
+                    security_issues = project.issues.select_related('project').filter(
+                        type__in=['VULNERABILITY', 'SECURITY_HOTSPOT'],
+                        severity__in=SEVERITY_AT_OR_ABOVE[jira_sonar_link.security_severity_threshold],
+                        status='OPEN'
+                    ).filter(~has_ticket)
                 
-                for issue in security_issues:
-                    success, message = self.create_jira_ticket_from_quality_issue(
-                        issue, jira_sonar_link, 'security'
-                    )
-                    if success:
-                        results['security_tickets'] += 1
-                    else:
-                        results['errors'].append(f"Security ticket creation failed: {message}")
-            
-            # Create technical debt tickets
-            if jira_sonar_link.auto_create_debt_tickets:
-                debt_threshold_minutes = jira_sonar_link.debt_threshold_hours * 60
-                debt_issues = project.issues.filter(
-                    type='CODE_SMELL',
-                    debt__gte=debt_threshold_minutes,
-                    status='OPEN'
-                ).exclude(
-                    jira_tickets__jira_sonar_link=jira_sonar_link
-                )
+                    for issue in security_issues.iterator(chunk_size=500):
+                        success, message = self.create_jira_ticket_from_quality_issue(
+                            issue, jira_sonar_link, 'security', **ticket_kwargs
+                        )
+                        if success:
+                            results['security_tickets'] += 1
+                            if len(pending_tickets) >= TICKET_LINK_BATCH_SIZE:
+                                self._link_pending_tickets(jira_sonar_link, pending_tickets)
+                        else:
+                            results['errors'].append(f"Security ticket creation failed: {message}")
+                
+                # Create technical debt tickets
+                if jira_sonar_link.auto_create_debt_tickets:
+                    debt_threshold_minutes = jira_sonar_link.debt_threshold_hours * 60
+                    debt_issues = project.issues.select_related('project').filter(
+                        type='CODE_SMELL',
+                        debt__gte=debt_threshold_minutes,
+                        status='OPEN'
+                    ).filter(~has_ticket)
                 
-                for issue in debt_issues:
-                    success, message = self.create_jira_ticket_from_quality_issue(
-                        issue, jira_sonar_link, 'debt'
-                    )
-                    if success:
-                        results['debt_tickets'] += 1
-                    else:
-                        results['errors'].append(f"Debt ticket creation failed: {message}")
+                    for issue in debt_issues.iterator(chunk_size=500):
+                        success, message = self.create_jira_ticket_from_quality_issue(
+                            issue, jira_sonar_link, 'debt', **ticket_kwargs
+                        )
+                        if success:
+                            results['debt_tickets'] += 1
+                            if len(pending_tickets) >= TICKET_LINK_BATCH_SIZE:
+                                self._link_pending_tickets(jira_sonar_link, pending_tickets)
+                        else:
+                            results['errors'].append(f"Debt ticket creation failed: {message}")
+            finally:
+                # Link the remaining tickets, including those created before a failure
+                self._link_pending_tickets(jira_sonar_link, pending_tickets)
             
             # Update sync tracking
             jira_sonar_link.last_ticket_creation_sync = django_timezone.now()
@@ -321,11 +400,21 @@ class ProductQualityService:
     """Service for calculating unified product health scores"""
     
     def __init__(self):
-        pass
+        self.cache_timeout = 300  # 5 minutes default cache
     
     def calculate_product_health_score(self, product) -> Dict:
         """Calculate unified health score for a product"""
         try:
+            # A new SonarCloud analysis changes the key, invalidating the entry
+            last_analysis = product.sonarcloud_projects.aggregate(
+                latest=Max('last_analysis')
+            )['latest']
+            version = last_analysis.timestamp() if last_analysis else 0
+            cache_key = f"product_health_score_{product.id}_{version}"
+            cached_data = cache.get(cache_key)
+            if cached_data:
+                return cached_data
+            
             health_data = {
                 'product': product,
                 'overall_score': 0,
@@ -350,6 +439,7 @@ class ProductQualityService:
             # Generate recommendations
             health_data['recommendations'] = self._generate_recommendations(health_data)
             
+            cache.set(cache_key, health_data, self.cache_timeout)
             return health_data
             
         except Exception as e:
@@ -358,13 +448,17 @@ class ProductQualityService:
     
     def _calculate_sentry_health(self, product) -> Dict:
         """Calculate Sentry-based health metrics"""
-        sentry_projects = product.sentryproject_set.all()
+        totals = product.sentryproject_set.aggregate(
+            projects=Count('id'),
+            total_issues=Sum('total_issues'),
+            unresolved_issues=Sum('unresolved_issues'),
+        )
         
-        if not sentry_projects.exists():
+        if not totals['projects']:
             return {'score': 100, 'status': 'no_data', 'details': 'No Sentry projects'}
         
-        total_issues = sum(p.total_issues for p in sentry_projects)
-        unresolved_issues = sum(p.unresolved_issues for p in sentry_projects)
+        total_issues = totals['total_issues'] or 0
+        unresolved_issues = totals['unresolved_issues'] or 0
         
         if total_issues == 0:
             return {'score': 100, 'status': 'excellent', 'details': 'No issues'}
@@ -389,13 +483,27 @@ class ProductQualityService:
     
     def _calculate_sonarcloud_health(self, product) -> Dict:
         """Calculate SonarCloud-based health metrics"""
-        sonar_projects = product.sonarcloud_projects.all()
+        # overall_quality_score is a Python property, so read just the rating
+        # and gate columns in one query and score them here
+        rows = list(product.sonarcloud_projects.values_list(
+            'reliability_rating', 'security_rating', 'maintainability_rating',
+            'quality_gate_status'
+        ))
         
-        if not sonar_projects.exists():
+        if not rows:
             return {'score': 100, 'status': 'no_data', 'details': 'No SonarCloud projects'}
         
         # Calculate average quality score
-        quality_scores = [p.overall_quality_score for p in sonar_projects if p.overall_quality_score]
+        quality_scores = []
+        gates = {'total': 0, 'passing': 0}
+        for reliability, security, maintainability, gate_status in rows:
+            score = quality_score_from_ratings(reliability, security, maintainability)
+            if score:
+                quality_scores.append(score)
+            if gate_status != 'NONE':
+                gates['total'] += 1
+                if gate_status == 'OK':
+                    gates['passing'] += 1
         
         if not quality_scores:
             return {'score': 50, 'status': 'no_analysis', 'details': 'No quality analysis available'}
@@ -403,10 +511,8 @@ class ProductQualityService:
         avg_quality = sum(quality_scores) / len(quality_scores)
         
         # Factor in quality gate status
-        projects_with_gates = sonar_projects.exclude(quality_gate_status='NONE')
-        if projects_with_gates.exists():
-            passing_gates = projects_with_gates.filter(quality_gate_status='OK').count()
-            gate_pass_rate = (passing_gates / projects_with_gates.count()) * 100
+        if gates['total']:
+            gate_pass_rate = (gates['passing'] / gates['total']) * 100
             
             # Combine quality score and gate pass rate
             final_score = (avg_quality * 0.7) + (gate_pass_rate * 0.3)
@@ -417,20 +523,24 @@ class ProductQualityService:
             'score': round(final_score, 1),
             'average_quality': round(avg_quality, 1),
             'projects_analyzed': len(quality_scores),
-            'quality_gates_passing': projects_with_gates.filter(quality_gate_status='OK').count(),
-            'quality_gates_total': projects_with_gates.count(),
+            'quality_gates_passing': gates['passing'],
+            'quality_gates_total': gates['total'],
             'status': 'excellent' if final_score >= 90 else 'good' if final_score >= 70 else 'needs_attention'
         }
     
     def _calculate_jira_health(self, product) -> Dict:
         """Calculate JIRA-based health metrics"""
-        jira_projects = product.jira_projects.all()
+        totals = product.jira_projects.aggregate(
+            projects=Count('id'),
+            total_issues=Sum('total_issues'),
+            open_issues=Sum('open_issues'),
+        )
         
-        if not jira_projects.exists():
+        if not totals['projects']:
             return {'score': 100, 'status': 'no_data', 'details': 'No JIRA projects'}
         
-        total_issues = sum(p.total_issues for p in jira_projects)
-        open_issues = sum(p.open_issues for p in jira_projects)
+        total_issues = totals['total_issues'] or 0
+        open_issues = totals['open_issues'] or 0
         
         if total_issues == 0:
             return {'score': 100, 'status': 'excellent', 'details': 'No issues'}
@@ -450,24 +560,7 @@ class ProductQualityService:
     
     def _score_to_grade(self, score: float) -> str:
         """Convert numeric score to letter grade"""
-        if score >= 95:
-            return 'A+'
-        elif score >= 90:
-            return 'A'
-        elif score >= 85:
-            return 'B+'
-        elif score >= 80:
-            return 'B'
-        elif score >= 75:
-            return 'C+'
-        elif score >= 70:
-            return 'C'
-        elif score >= 65:
-            return 'D+'
-        elif score >= 60:
-            return 'D'
-        else:
-            return 'F'
+        return GRADES[bisect_right(GRADE_THRESHOLDS, score)]
     
     def _generate_recommendations(self, health_data: Dict) -> List[str]:
         """Generate actionable recommendations based on health data"""
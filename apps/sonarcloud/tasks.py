@@ -0,0 +1,69 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from django.db import connection
+from django.db.models import Q
+
+from .models import JiraSonarLink
+from .services_integration import JiraQualityService
+
+logger = logging.getLogger(__name__)
+
+
+def process_link_ticket_creation(link_id: int) -> Dict:
+    """
+    Task to run automated JIRA ticket creation for a single JIRA-SonarCloud link.
+    This function can be called by cron jobs, Celery, or other task schedulers.
+    """
+    try:
+        link = JiraSonarLink.objects.select_related(
+            'sonarcloud_project', 'jira_project__jira_organization'
+        ).get(id=link_id)
+    except JiraSonarLink.DoesNotExist:
+        logger.error(f"JIRA-SonarCloud link with ID {link_id} not found")
+        return {'link_id': link_id, 'security_tickets': 0, 'debt_tickets': 0,
+                'coverage_tickets': 0, 'errors': ['Link not found']}
+    
+    results = JiraQualityService().process_automated_ticket_creation(link)
+    results['link_id'] = link_id
+    return results
+
+
+def _process_link_in_thread(link_id: int) -> Dict:
+    """Run one link's ticket creation from a worker thread, releasing its DB connection afterwards
+
+    Errors are returned in the link's result so one failing link does not
+    discard the results of the others.
+    """
+    try:
+        return process_link_ticket_creation(link_id)
+    except Exception as e:
+        logger.error(f"Automated ticket creation failed for link {link_id}: {str(e)}")
+        return {'link_id': link_id, 'security_tickets': 0, 'debt_tickets': 0,
+                'coverage_tickets': 0, 'errors': [str(e)]}
+    finally:
+        connection.close()
+
+
+def process_automated_ticket_creation(link_ids: Optional[List[int]] = None,
+                                      max_workers: int = 4) -> List[Dict]:
+    """
+    Periodic task to run automated JIRA ticket creation, sharded per link.
+    Links share no state, so each one is processed on its own worker thread and
+    the blocking JIRA API calls of different links overlap.
+    """
+    if link_ids is None:
+        link_ids = list(
+            JiraSonarLink.objects.filter(
+                Q(auto_create_security_tickets=True) | Q(auto_create_debt_tickets=True)
+            ).values_list('id', flat=True)
+        )
+    
+    if not link_ids:
+        logger.info("No JIRA-SonarCloud links need ticket processing")
+        return []
+    
+    logger.info(f"Processing automated tickets for {len(link_ids)} links")
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(link_ids))) as executor:
+        return list(executor.map(_process_link_in_thread, link_ids))
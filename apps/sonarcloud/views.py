@@ -3,6 +3,7 @@ from django.http import JsonResponse
 from django.contrib.admin.views.decorators import staff_member_required
 from django.views.decorators.http import require_http_methods
 from django.contrib import messages
+from django.db.models import Count, Q
 
 from .models import SonarCloudOrganization, SonarCloudProject
 from .services import sync_sonarcloud_organization
@@ -13,20 +14,26 @@ def dashboard(request):
     organizations = SonarCloudOrganization.objects.all()
     
     # Get summary statistics
-    total_projects = SonarCloudProject.objects.count()
-    projects_with_quality_gate = SonarCloudProject.objects.exclude(quality_gate_status='NONE').count()
-    projects_passing_gate = SonarCloudProject.objects.filter(quality_gate_status='OK').count()
+    stats = SonarCloudProject.objects.aggregate(
+        total=Count('id'),
+        with_gate=Count('id', filter=~Q(quality_gate_status='NONE')),
+        passing=Count('id', filter=Q(quality_gate_status='OK')),
+    )
     
     # Get recent projects
     recent_projects = SonarCloudProject.objects.filter(
         last_analysis__isnull=False
+    ).select_related('sonarcloud_organization').only(
+        'id', 'project_key', 'name', 'quality_gate_status', 'last_analysis',
+        'reliability_rating', 'security_rating', 'maintainability_rating', 'coverage',
+        'sonarcloud_organization__name', 'sonarcloud_organization__organization_key',
     ).order_by('-last_analysis')[:10]
     
     context = {
         'organizations': organizations,
-        'total_projects': total_projects,
-        'projects_with_quality_gate': projects_with_quality_gate,
-        'projects_passing_gate': projects_passing_gate,
+        'total_projects': stats['total'],
+        'projects_with_quality_gate': stats['with_gate'],
+        'projects_passing_gate': stats['passing'],
         'recent_projects': recent_projects,
     }
     
@@ -47,21 +54,30 @@ def organizations_list(request):
 def organization_detail(request, org_id):
     """Detail view for a specific SonarCloud organization"""
     organization = get_object_or_404(SonarCloudOrganization, id=org_id)
-    projects = organization.projects.all().order_by('name')
+    projects = organization.projects.order_by('name')
     
     # Get organization statistics
-    total_projects = projects.count()
-    projects_with_analysis = projects.filter(last_analysis__isnull=False).count()
-    projects_passing_gate = projects.filter(quality_gate_status='OK').count()
-    projects_failing_gate = projects.filter(quality_gate_status='ERROR').count()
+    stats = projects.aggregate(
+        total=Count('id'),
+        with_analysis=Count('id', filter=Q(last_analysis__isnull=False)),
+        passing=Count('id', filter=Q(quality_gate_status='OK')),
+        failing=Count('id', filter=Q(quality_gate_status='ERROR')),
+    )
     
     context = {
         'organization': organization,
-        'projects': projects,
-        'total_projects': total_projects,
-        'projects_with_analysis': projects_with_analysis,
-        'projects_passing_gate': projects_passing_gate,
-        'projects_failing_gate': projects_failing_gate,
+        # Model instances keep sonarcloud_url, the quality properties and the
+        # get_*_display methods; only the listed columns are loaded
+        'projects': projects.only(
+            'id', 'sonarcloud_organization_id', 'project_key', 'name', 'language',
+            'quality_gate_status', 'reliability_rating', 'security_rating',
+            'maintainability_rating', 'coverage', 'lines_of_code', 'technical_debt',
+            'bugs', 'vulnerabilities', 'code_smells', 'last_analysis',
+        ),
+        'total_projects': stats['total'],
+        'projects_with_analysis': stats['with_analysis'],
+        'projects_passing_gate': stats['passing'],
+        'projects_failing_gate': stats['failing'],
     }
     
     return render(request, 'sonarcloud/organization_detail.html', context)
@@ -71,11 +87,20 @@ def project_detail(request, project_id):
     """Detail view for a specific SonarCloud project"""
     project = get_object_or_404(SonarCloudProject, id=project_id)
     
-    # Get recent measurements for trend analysis
-    recent_measurements = project.measurements.order_by('-analysis_date')[:10]
+    # Get recent measurements for trend analysis (the related manager already
+    # attaches `project`, so no select_related is needed on either queryset)
+    recent_measurements = project.measurements.only(
+        'id', 'project_id', 'analysis_date', 'branch', 'quality_gate_status',
+        'reliability_rating', 'security_rating', 'maintainability_rating',
+        'coverage', 'duplication', 'lines_of_code', 'technical_debt',
+        'bugs', 'vulnerabilities', 'security_hotspots', 'code_smells',
+    ).order_by('-analysis_date')[:10]
     
     # Get recent issues
-    recent_issues = project.issues.order_by('-creation_date')[:20]
+    recent_issues = project.issues.only(
+        'id', 'project_id', 'sonarcloud_key', 'rule', 'severity', 'type',
+        'message', 'component', 'line', 'status', 'effort', 'debt', 'creation_date',
+    ).order_by('-creation_date')[:20]
     
     context = {
         'project': project,
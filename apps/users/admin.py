@@ -43,10 +43,6 @@ class UserAdmin(BaseUserAdmin):
     
     readonly_fields = ('date_joined', 'last_login', 'created_at', 'updated_at')
     
-    def get_queryset(self, request):
-        """Optimize queryset"""
-        return super().get_queryset(request).select_related()
-    
     actions = ['activate_users', 'deactivate_users', 'make_admin', 'make_regular_user']
     
     def activate_users(self, request, queryset):
@@ -11,6 +11,7 @@ class User(AbstractUser):
         ADMIN = 'admin', 'Admin'
         SUPER_ADMIN = 'super_admin', 'Super Admin'
 
+    _ADMIN_ROLES = frozenset({UserRole.ADMIN.value, UserRole.SUPER_ADMIN.value})
 
     # Basic Information
     email = models.EmailField(unique=True)
@@ -33,16 +34,25 @@ class User(AbstractUser):
     def __str__(self):
         return f"{self.get_full_name()} ({self.email})"
 
+    @property
+    def full_name(self):
+        """The first_name plus the last_name, with a space in between."""
+        first_name, last_name = self.first_name, self.last_name
+        if first_name and last_name:
+            return first_name + ' ' + last_name
+        return first_name or last_name or ''
+
     def get_full_name(self):
         """Return the first_name plus the last_name, with a space in between."""
-        full_name = f"{self.first_name} {self.last_name}"
-        return full_name.strip()
+        return self.full_name
 
     def is_admin(self):
         """Check if user is admin or super admin"""
-        return self.role in [self.UserRole.ADMIN, self.UserRole.SUPER_ADMIN]
+        return self.role in User._ADMIN_ROLES
 
     def is_super_admin(self):
         """Check if user is super admin"""
         return self.role == self.UserRole.SUPER_ADMIN
 
+
+VALID_USER_ROLES = frozenset(User.UserRole.values)
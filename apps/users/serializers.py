@@ -1,28 +1,103 @@
+import copy
+import secrets
+
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
+from django.db.models.manager import BaseManager
 from .models import User
 
-class UserSerializer(serializers.ModelSerializer):
+USERNAME_RETRY_ATTEMPTS = 3
+_PHONE_STRIP = str.maketrans({'+': None, '-': None, ' ': None})
+
+# UserSerializer fields whose model value is already JSON-ready
+_PLAIN_USER_FIELDS = frozenset({
+    'id', 'username', 'email', 'first_name', 'last_name', 'full_name', 'phone_number',
+    'role', 'account_type', 'address', 'city', 'state', 'country',
+    'occupation', 'total_groups', 'is_active',
+})
+
+_USER_COLUMNS = frozenset(field.name for field in User._meta.concrete_fields)
+
+
+class CachedFieldsMixin:
+    """Build ModelSerializer fields once per class and hand out copies"""
+    
+    _cached_fields = {}
+    
+    def get_fields(self):
+        key = (type(self), tuple(self.Meta.fields))
+        fields = CachedFieldsMixin._cached_fields.get(key)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsMixin._cached_fields[key] = fields
+        return {name: copy.deepcopy(field) for name, field in fields.items()}
+
+class UserListSerializer(serializers.ListSerializer):
+    """List serializer that reads unevaluated querysets through iterator()"""
+    
+    def to_representation(self, data):
+        if isinstance(data, BaseManager):
+            data = data.all()
+        # iterator() skips the queryset result cache, but it would discard
+        # prefetches and re-run a queryset that has already been fetched
+        if (isinstance(data, QuerySet) and data._result_cache is None
+                and not data._prefetch_related_lookups):
+            data = data.iterator()
+        return [self.child.to_representation(item) for item in data]
+
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for User model"""
     
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.ReadOnlyField()
     
     class Meta:
         model = User
-        fields = [
+        fields = (
             'id', 'username', 'email', 'first_name', 'last_name', 'full_name',
             'phone_number', 'role', 'account_type', 'address', 'city', 'state',
             'country', 'profile_picture', 'date_of_birth', 'occupation',
             'total_contributions', 'total_groups', 'is_active', 'date_joined',
             'created_at', 'updated_at'
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'id', 'username', 'total_contributions', 'total_groups',
             'is_active', 'date_joined', 'created_at', 'updated_at'
-        ]
-    
-    def get_full_name(self, obj):
-        return obj.get_full_name()
+        )
+        list_serializer_class = UserListSerializer
+    
+    _cached_writable = None
+    
+    @property
+    def _writable_fields(self):
+        # The writable field names only depend on the class, so work them out once
+        fields = self.fields
+        cls = type(self)
+        if '_cached_writable' not in cls.__dict__ or cls._cached_writable is None:
+            cls._cached_writable = tuple(
+                name for name, field in fields.items() if not field.read_only
+            )
+        return [fields[name] for name in cls._cached_writable]
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load only the User columns this serializer reads"""
+        return queryset.only(*(name for name in cls.Meta.fields if name in _USER_COLUMNS))
+    
+    def to_representation(self, instance):
+        """Read plain columns directly and only dispatch typed fields through DRF"""
+        fields = self.fields
+        data = {}
+        for name in self.Meta.fields:
+            if name in _PLAIN_USER_FIELDS:
+                data[name] = getattr(instance, name)
+                continue
+            field = fields[name]
+            attribute = field.get_attribute(instance)
+            data[name] = None if attribute is None else field.to_representation(attribute)
+        return data
 
 class UserProfileSerializer(serializers.ModelSerializer):
     """Serializer for user profile updates"""
@@ -35,8 +110,12 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'date_of_birth', 'occupation'
         ]
     
+    def to_representation(self, instance):
+        """Represent the saved profile with the full UserSerializer output"""
+        return UserSerializer(instance, context=self.context).data
+    
     def validate_phone_number(self, value):
-        if value and not value.replace('+', '').replace('-', '').replace(' ', '').isdigit():
+        if value and not value.translate(_PHONE_STRIP).isdigit():
             raise serializers.ValidationError("Invalid phone number format")
         return value
 
@@ -59,29 +138,35 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return attrs
     
     def validate_email(self, value):
-        if User.objects.filter(email=value.lower()).exists():
-            raise serializers.ValidationError("User with this email already exists")
         return value.lower()
     
     def create(self, validated_data):
         validated_data.pop('password_confirm')
         password = validated_data.pop('password')
         
-        # Create username from email
+        # Create username from email; let the unique constraints decide
+        # collisions instead of checking before the INSERT
         email = validated_data['email']
-        username = email.split('@')[0]
-        counter = 1
-        original_username = username
-        while User.objects.filter(username=username).exists():
-            username = f"{original_username}{counter}"
-            counter += 1
-        
-        validated_data['username'] = username
+        original_username = email.split('@')[0]
+        validated_data['username'] = original_username
+
+        for attempt in range(USERNAME_RETRY_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    user = User.objects.create_user(password=password, **validated_data)
+                break
+            except IntegrityError:
+                if User.objects.filter(email=email).exists():
+                    raise serializers.ValidationError({'email': "User with this email already exists"})
+                # Only a taken username is retried; any other constraint failure propagates
+                username_taken = User.objects.filter(username=validated_data['username']).exists()
+                if not username_taken or attempt == USERNAME_RETRY_ATTEMPTS - 1:
+                    raise
+                validated_data['username'] = f"{original_username}{secrets.token_hex(3)}"
         
-        user = User.objects.create_user(password=password, **validated_data)
         return user
 
-class UserStatsSerializer(serializers.ModelSerializer):
+class UserStatsSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for user statistics"""
     
     active_groups = serializers.SerializerMethodField()
@@ -116,16 +201,20 @@ class UserStatsSerializer(serializers.ModelSerializer):
             status='completed'
         ).count()
 
-class PublicUserSerializer(serializers.ModelSerializer):
+class PublicUserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for public user information (limited fields)"""
     
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.ReadOnlyField()
     
     class Meta:
         model = User
         fields = [
             'id', 'full_name', 'profile_picture', 'role'
         ]
+        read_only_fields = ['id', 'full_name', 'profile_picture', 'role']
     
-    def get_full_name(self, obj):
-        return obj.get_full_name()
\ No newline at end of file
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load only the columns exposed publicly; list views should call this"""
+        # profile_picture is listed in Meta.fields but is not a User column yet
+        return queryset.only('id', 'first_name', 'last_name', 'role')
@@ -0,0 +1,46 @@
+"""
+Shared pytest fixtures for users app tests.
+"""
+import pytest
+from rest_framework.test import APIClient
+from apps.users.tests.factories import UserFactory, SuperAdminUserFactory
+
+
+@pytest.fixture(scope='class')
+def class_user(django_db_setup, django_db_blocker):
+    """User created once per test class; tests must not modify it."""
+    with django_db_blocker.unblock():
+        user = UserFactory()
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+@pytest.fixture(scope='class')
+def authenticated_client(class_user):
+    """API client authenticated as the class-scoped user."""
+    client = APIClient()
+    client.force_authenticate(user=class_user)
+    return client
+
+
+@pytest.fixture
+def user(db):
+    """Fresh user for tests that modify it."""
+    return UserFactory()
+
+
+@pytest.fixture
+def user_client(user):
+    """API client authenticated as the function-scoped user."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def super_admin_client(db):
+    """API client authenticated as a super admin."""
+    client = APIClient()
+    client.force_authenticate(user=SuperAdminUserFactory())
+    return client
@@ -3,10 +3,25 @@ Factory classes for users app models.
 """
 import factory
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from faker import Faker
 from apps.users.models import Customer, BankAccount
 
 User = get_user_model()
 
+_faker = Faker()
+
+# Hashed once; hashing per user dominates the cost of creating test users
+_PASSWORD_HASH = make_password('testpass123')
+
+
+def bulk_create_users(users):
+    """Save built users with a single bulk INSERT (model signals do not fire)."""
+    users = list(users)
+    for user in users:
+        user.password = _PASSWORD_HASH
+    return User.objects.bulk_create(users, batch_size=1000)
+
 
 class UserFactory(factory.django.DjangoModelFactory):
     """Factory for creating User instances."""
@@ -16,11 +31,16 @@ class UserFactory(factory.django.DjangoModelFactory):
     
     username = factory.Sequence(lambda n: f"user{n}")
     email = factory.LazyAttribute(lambda obj: f"{obj.username}@example.com")
-    first_name = factory.Faker('first_name')
-    last_name = factory.Faker('last_name')
+    first_name = factory.LazyFunction(_faker.first_name)
+    last_name = factory.LazyFunction(_faker.last_name)
     role = User.UserRole.MEMBER
     account_type = User.AccountType.INDIVIDUAL
     is_active = True
+    
+    @classmethod
+    def create_batch_bulk(cls, size, **kwargs):
+        """Create users with a single bulk INSERT (model signals do not fire)."""
+        return bulk_create_users(cls.build_batch(size, **kwargs))
 
 
 class AdminUserFactory(UserFactory):
@@ -44,17 +64,17 @@ class CustomerFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Customer
     
-    name = factory.Faker('name')
+    name = factory.LazyFunction(_faker.name)
     user = factory.SubFactory(UserFactory)
-    address = factory.Faker('address')
-    city = factory.Faker('city')
-    state = factory.Faker('state')
+    address = factory.LazyFunction(_faker.address)
+    city = factory.LazyFunction(_faker.city)
+    state = factory.LazyFunction(_faker.state)
     country = 'Nigeria'
-    phone_number = factory.Faker('phone_number')
-    date_of_birth = factory.Faker('date_of_birth')
-    occupation = factory.Faker('job')
-    total_contributions = factory.Faker('pydecimal', left_digits=8, right_digits=2, positive=True)
-    total_groups = factory.Faker('pyint', min_value=0, max_value=10)
+    phone_number = factory.LazyFunction(_faker.phone_number)
+    date_of_birth = factory.LazyFunction(_faker.date_of_birth)
+    occupation = factory.LazyFunction(_faker.job)
+    total_contributions = factory.LazyFunction(lambda: _faker.pydecimal(left_digits=8, right_digits=2, positive=True))
+    total_groups = factory.LazyFunction(lambda: _faker.pyint(min_value=0, max_value=10))
 
 
 class BankAccountFactory(factory.django.DjangoModelFactory):
@@ -64,7 +84,7 @@ class BankAccountFactory(factory.django.DjangoModelFactory):
         model = BankAccount
     
     customer = factory.SubFactory(CustomerFactory)
-    bank_name = factory.Faker('company')
-    account_number = factory.Faker('numerify', text='##########')
+    bank_name = factory.LazyFunction(_faker.company)
+    account_number = factory.LazyFunction(lambda: _faker.numerify(text='##########'))
     account_name = factory.LazyAttribute(lambda obj: obj.customer.name)
     is_primary = True
\ No newline at end of file
@@ -15,6 +15,12 @@ User = get_user_model()
 class UserModelTest(TestCase):
     """Test User model functionality."""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = UserFactory(role=User.UserRole.MEMBER)
+        cls.admin = UserFactory(role=User.UserRole.ADMIN)
+        cls.super_admin = UserFactory(role=User.UserRole.SUPER_ADMIN)
+    
     def setUp(self):
         self.user_data = {
             'username': 'testuser',
@@ -61,6 +67,17 @@ class UserModelTest(TestCase):
         self.assertTrue(super_admin.is_staff)
         self.assertTrue(super_admin.is_superuser)
     
+    def test_user_factory_create_batch_bulk(self):
+        """Test bulk user creation using factory."""
+        users = UserFactory.create_batch_bulk(5, role=User.UserRole.ADMIN)
+        
+        self.assertEqual(len(users), 5)
+        self.assertEqual(
+            User.objects.filter(username__in=[user.username for user in users], role=User.UserRole.ADMIN).count(),
+            5
+        )
+        self.assertTrue(users[0].check_password('testpass123'))
+    
     def test_email_uniqueness_constraint(self):
         """Test that email must be unique."""
         UserFactory(email='test@example.com')
@@ -83,23 +100,15 @@ class UserModelTest(TestCase):
     
     def test_is_admin_method(self):
         """Test is_admin method returns correct boolean."""
-        member = UserFactory(role=User.UserRole.MEMBER)
-        admin = UserFactory(role=User.UserRole.ADMIN)
-        super_admin = UserFactory(role=User.UserRole.SUPER_ADMIN)
-        
-        self.assertFalse(member.is_admin())
-        self.assertTrue(admin.is_admin())
-        self.assertTrue(super_admin.is_admin())
+        self.assertFalse(self.member.is_admin())
+        self.assertTrue(self.admin.is_admin())
+        self.assertTrue(self.super_admin.is_admin())
     
     def test_is_super_admin_method(self):
         """Test is_super_admin method returns correct boolean."""
-        member = UserFactory(role=User.UserRole.MEMBER)
-        admin = UserFactory(role=User.UserRole.ADMIN)
-        super_admin = UserFactory(role=User.UserRole.SUPER_ADMIN)
-        
-        self.assertFalse(member.is_super_admin())
-        self.assertFalse(admin.is_super_admin())
-        self.assertTrue(super_admin.is_super_admin())
+        self.assertFalse(self.member.is_super_admin())
+        self.assertFalse(self.admin.is_super_admin())
+        self.assertTrue(self.super_admin.is_super_admin())
     
     def test_user_str_method(self):
         """Test User string representation."""
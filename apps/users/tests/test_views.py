@@ -3,24 +3,36 @@ Tests for users app views/APIs.
 """
 import pytest
 from django.test import TestCase
-from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework.test import APITestCase
-from apps.users.tests.factories import UserFactory, AdminUserFactory, SuperAdminUserFactory, CustomerFactory
+from apps.users.models import VALID_USER_ROLES
+from apps.users.tests.factories import (
+    UserFactory, AdminUserFactory, SuperAdminUserFactory, CustomerFactory, bulk_create_users,
+)
 from apps.groups.tests.factories import GroupFactory, GroupMemberFactory
 from apps.contributions.tests.factories import ContributionFactory
 from tests.mixins import AuthenticatedAPITestMixin, AdminAPITestMixin, APITestMixin
 
 User = get_user_model()
 
+pytestmark = pytest.mark.django_db
+
+# Profile endpoint path, shared by every test in the module
+USER_PROFILE_URL = '/api/users/profile/'
+
+# Upper bound on queries for the list endpoints; tighten as eager loading lands
+MAX_LIST_QUERIES = 8
+
 
 class UserProfileViewTest(APITestCase, AuthenticatedAPITestMixin):
     """Test UserProfileView API endpoint."""
     
     def setUp(self):
         super().setUp()
-        self.url = reverse('user-profile') if hasattr(self, 'reverse') else '/api/users/profile/'
+        self.url = USER_PROFILE_URL
     
     def test_get_user_profile_authenticated(self):
         """Test authenticated user can retrieve their profile."""
@@ -108,9 +120,11 @@ class UserDashboardStatsTest(APITestCase, AuthenticatedAPITestMixin):
         GroupMemberFactory(group=group, user=self.user, status='active')
         ContributionFactory(group=group, member=self.user)
         
-        response = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
         
         self.assert_api_success(response, 200)
+        self.assertLessEqual(len(queries), MAX_LIST_QUERIES)
         self.assertIsInstance(response.data['monthly_contributions'], list)
         self.assertIsInstance(response.data['upcoming_contributions'], list)
     
@@ -141,13 +155,21 @@ class UserGroupsTest(APITestCase, AuthenticatedAPITestMixin):
         """Test user can get their groups list."""
         # Create groups for the user
         group1 = GroupFactory()
-        group2 = GroupFactory()
         GroupMemberFactory(group=group1, user=self.user, status='active')
+        
+        with CaptureQueriesContext(connection) as single_group_queries:
+            self.client.get(self.url)
+        
+        group2 = GroupFactory()
         GroupMemberFactory(group=group2, user=self.user, status='pending')
         
-        response = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
         
         self.assert_api_success(response, 200)
+        # Another group must not add queries (N+1 regression guard)
+        self.assertEqual(len(queries), len(single_group_queries))
+        self.assertLessEqual(len(queries), MAX_LIST_QUERIES)
         self.assertIn('groups', response.data)
         self.assertIn('total_count', response.data)
         self.assertEqual(response.data['total_count'], 2)
@@ -183,9 +205,11 @@ class UserContributionsTest(APITestCase, AuthenticatedAPITestMixin):
         ContributionFactory(group=group, member=self.user, cycle_number=1)
         ContributionFactory(group=group, member=self.user, cycle_number=2)
         
-        response = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
         
         self.assert_api_success(response, 200)
+        self.assertLessEqual(len(queries), MAX_LIST_QUERIES)
         self.assertIn('contributions', response.data)
         self.assertIn('total_count', response.data)
         self.assertEqual(response.data['total_count'], 2)
@@ -235,7 +259,9 @@ class UpdateUserRoleTest(APITestCase):
             'user_id': self.regular_user.id,
             'role': User.UserRole.ADMIN
         }
-        response = self.client.post(self.url, data)
+        # Request savepoint, the user SELECT, the role UPDATE and the release
+        with self.assertNumQueries(4):
+            response = self.client.post(self.url, data)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.regular_user.refresh_from_db()
@@ -253,50 +279,6 @@ class UpdateUserRoleTest(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
     
-    def test_update_user_role_invalid_role(self):
-        """Test update user role with invalid role."""
-        self.client.force_authenticate(user=self.super_admin)
-        
-        data = {
-            'user_id': self.regular_user.id,
-            'role': 'invalid_role'
-        }
-        response = self.client.post(self.url, data)
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-    
-    def test_update_user_role_missing_data(self):
-        """Test update user role with missing data."""
-        self.client.force_authenticate(user=self.super_admin)
-        
-        # Missing role
-        data = {
-            'user_id': self.regular_user.id
-        }
-        response = self.client.post(self.url, data)
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Missing user_id
-        data = {
-            'role': User.UserRole.ADMIN
-        }
-        response = self.client.post(self.url, data)
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-    
-    def test_update_user_role_user_not_found(self):
-        """Test update user role with non-existent user."""
-        self.client.force_authenticate(user=self.super_admin)
-        
-        data = {
-            'user_id': 99999,  # Non-existent user ID
-            'role': User.UserRole.ADMIN
-        }
-        response = self.client.post(self.url, data)
-        
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-    
     def test_update_user_role_unauthenticated(self):
         """Test unauthenticated request returns 401."""
         data = {
@@ -308,20 +290,57 @@ class UpdateUserRoleTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+# Placeholder replaced by the target user's id inside the test
+TARGET_USER_ID = object()
+
+
+@pytest.mark.parametrize('payload,expected_status', [
+    pytest.param(
+        {'user_id': TARGET_USER_ID, 'role': 'invalid_role'},
+        status.HTTP_400_BAD_REQUEST, id='invalid-role'
+    ),
+    pytest.param(
+        {'user_id': TARGET_USER_ID},
+        status.HTTP_400_BAD_REQUEST, id='missing-role'
+    ),
+    pytest.param(
+        {'role': User.UserRole.ADMIN},
+        status.HTTP_400_BAD_REQUEST, id='missing-user-id'
+    ),
+    pytest.param(
+        {'user_id': 99999, 'role': User.UserRole.ADMIN},
+        status.HTTP_404_NOT_FOUND, id='user-not-found'
+    ),
+])
+def test_update_user_role_rejected(super_admin_client, user, payload, expected_status):
+    """Test invalid update user role requests are rejected without changes."""
+    assert 'invalid_role' not in VALID_USER_ROLES
+    data = {
+        key: user.id if value is TARGET_USER_ID else value
+        for key, value in payload.items()
+    }
+    
+    response = super_admin_client.post('/api/users/update-role/', data)
+    
+    assert response.status_code == expected_status
+    user.refresh_from_db()
+    assert user.role == User.UserRole.MEMBER
+
+
 class UserAPIPermissionTest(APITestCase):
     """Test user API permission enforcement."""
     
     def setUp(self):
-        self.user = UserFactory()
-        self.admin = AdminUserFactory()
-        self.super_admin = SuperAdminUserFactory()
+        self.user, self.admin, self.super_admin = bulk_create_users(
+            (UserFactory.build(), AdminUserFactory.build(), SuperAdminUserFactory.build())
+        )
     
     def test_profile_access_own_data_only(self):
         """Test users can only access their own profile data."""
         self.client.force_authenticate(user=self.user)
         
         # Should be able to access own profile
-        response = self.client.get('/api/users/profile/')
+        response = self.client.get(USER_PROFILE_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['email'], self.user.email)
     
@@ -376,7 +395,7 @@ class UserAPIResponseFormatTest(APITestCase, AuthenticatedAPITestMixin):
     
     def test_profile_response_format(self):
         """Test user profile response contains required fields."""
-        response = self.client.get('/api/users/profile/')
+        response = self.client.get(USER_PROFILE_URL)
         
         self.assert_api_success(response, 200)
         
@@ -411,35 +430,26 @@ class UserAPIResponseFormatTest(APITestCase, AuthenticatedAPITestMixin):
         self.assert_response_contains_fields(response.data, required_fields)
 
 
-class UserAPIErrorHandlingTest(APITestCase):
+class TestUserAPIErrorHandling:
     """Test user API error handling."""
     
-    def test_profile_update_server_error_handling(self):
+    def test_profile_update_server_error_handling(self, user_client):
         """Test profile update handles server errors gracefully."""
-        user = UserFactory()
-        self.client.force_authenticate(user=user)
-        
         # This would test error handling, but we need to mock a server error
         # For now, we test that the endpoint exists and handles requests
-        response = self.client.put('/api/users/profile/', {})
+        response = user_client.put(USER_PROFILE_URL, {})
         
         # Should return some response (either success or validation error)
-        self.assertIn(response.status_code, [200, 400, 500])
+        assert response.status_code in [200, 400, 500]
     
-    def test_dashboard_stats_error_handling(self):
+    def test_dashboard_stats_error_handling(self, authenticated_client):
         """Test dashboard stats handles errors gracefully."""
-        user = UserFactory()
-        self.client.force_authenticate(user=user)
-        
-        response = self.client.get('/api/users/dashboard-stats/')
+        response = authenticated_client.get('/api/users/dashboard-stats/')
         
         # Should return some response
-        self.assertIn(response.status_code, [200, 500])
+        assert response.status_code in [200, 500]
     
-    def test_invalid_endpoints(self):
+    def test_invalid_endpoints(self, authenticated_client):
         """Test invalid endpoints return 404."""
-        user = UserFactory()
-        self.client.force_authenticate(user=user)
-        
-        response = self.client.get('/api/users/invalid-endpoint/')
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+        response = authenticated_client.get('/api/users/invalid-endpoint/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -3,9 +3,10 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.db.models import Sum, Count
+from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from datetime import timedelta
-from .models import User
+from .models import User, VALID_USER_ROLES
 from .serializers import (
     UserSerializer, UserProfileSerializer, UserStatsSerializer
 )
@@ -14,6 +15,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
 class UserProfileView(APIView):
     """View for user profile management"""
     
@@ -21,99 +23,68 @@ class UserProfileView(APIView):
     
     def get(self, request):
         """Get current user profile"""
-        try:
-            serializer = UserSerializer(request.user)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            logger.error(f"Error fetching user profile: {str(e)}")
-            return Response(
-                {'error': 'Failed to fetch profile'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        serializer = UserSerializer(request.user)
+        return Response(serializer.data, status=status.HTTP_200_OK)
     
     def put(self, request):
         """Update user profile"""
-        try:
-            serializer = UserProfileSerializer(
-                request.user,
-                data=request.data,
-                partial=True
-            )
-            
-            if serializer.is_valid():
-                serializer.save()
-                
-                # Return updated user data
-                user_serializer = UserSerializer(request.user)
-                
-                logger.info(f"Profile updated for user: {request.user.email}")
-                
-                return Response({
-                    'message': 'Profile updated successfully',
-                    'user': user_serializer.data
-                }, status=status.HTTP_200_OK)
+        serializer = UserProfileSerializer(
+            request.user,
+            data=request.data,
+            partial=True,
+            context={'request': request}
+        )
+        
+        if serializer.is_valid():
+            serializer.save()
             
-            return Response(
-                serializer.errors,
-                status=status.HTTP_400_BAD_REQUEST
-            )
+            logger.info(f"Profile updated for user: {request.user.email}")
             
-        except Exception as e:
-            logger.error(f"Error updating user profile: {str(e)}")
-            return Response(
-                {'error': 'Failed to update profile'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+            # The profile serializer already represents the full user
+            return Response({
+                'message': 'Profile updated successfully',
+                'user': serializer.data
+            }, status=status.HTTP_200_OK)
+        
+        return Response(
+            serializer.errors,
+            status=status.HTTP_400_BAD_REQUEST
+        )
 
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def update_user_role(request):
     """Update user role (admin only)"""
-    try:
-        # Check if user is admin
-        if not request.user.is_super_admin():
-            return Response(
-                {'error': 'Permission denied'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
-        user_id = request.data.get('user_id')
-        new_role = request.data.get('role')
-        
-        if not user_id or not new_role:
-            return Response(
-                {'error': 'User ID and role are required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        if new_role not in [choice[0] for choice in User.UserRole.choices]:
-            return Response(
-                {'error': 'Invalid role'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        try:
-            user = User.objects.get(id=user_id)
-            user.role = new_role
-            user.save()
-            
-            logger.info(f"User role updated: {user.email} -> {new_role}")
-            
-            return Response({
-                'message': 'User role updated successfully',
-                'user': UserSerializer(user).data
-            }, status=status.HTTP_200_OK)
-            
-        except User.DoesNotExist:
-            return Response(
-                {'error': 'User not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-    except Exception as e:
-        logger.error(f"Error updating user role: {str(e)}")
+    # Check if user is admin
+    if not request.user.is_super_admin():
+        return Response(
+            {'error': 'Permission denied'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    user_id = request.data.get('user_id')
+    new_role = request.data.get('role')
+    
+    if not user_id or not new_role:
+        return Response(
+            {'error': 'User ID and role are required'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if new_role not in VALID_USER_ROLES:
         return Response(
-            {'error': 'Failed to update user role'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+            {'error': 'Invalid role'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    user = get_object_or_404(UserSerializer.setup_eager_loading(User.objects.all()), id=user_id)
+    user.role = new_role
+    user.save(update_fields=['role', 'updated_at'])
+    
+    logger.info(f"User role updated: {user.email} -> {new_role}")
+    
+    return Response({
+        'message': 'User role updated successfully',
+        'user': UserSerializer(user).data
+    }, status=status.HTTP_200_OK)
@@ -0,0 +1,24 @@
+import logging
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler, set_rollback
+
+logger = logging.getLogger(__name__)
+
+
+def api_exception_handler(exc, context):
+    """DRF exception handler that turns unhandled errors into logged 500 responses"""
+    response = exception_handler(exc, context)
+    if response is not None:
+        return response
+
+    view = context.get('view')
+    view_name = view.__class__.__name__ if view is not None else 'unknown view'
+    logger.error(f"Unhandled error in {view_name}: {str(exc)}", exc_info=exc)
+    # The error is answered rather than raised, so ATOMIC_REQUESTS would commit
+    set_rollback()
+    return Response(
+        {'error': 'Internal server error'},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
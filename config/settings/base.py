@@ -113,6 +113,13 @@ DATABASES = {
 }
 
 
+# Django REST framework
+
+REST_FRAMEWORK = {
+    "EXCEPTION_HANDLER": "config.exceptions.api_exception_handler",
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
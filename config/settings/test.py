@@ -0,0 +1,37 @@
+from django.db.backends.signals import connection_created
+
+from .base import *
+
+DEBUG = False
+
+SECRET_KEY = "django-insecure-test-settings-only"
+
+ALLOWED_HOSTS = ["*"]
+
+EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+# In-memory SQLite: the test suite never touches the disk
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "ATOMIC_REQUESTS": True,
+    }
+}
+
+
+def _disable_sqlite_durability(sender, connection, **kwargs):
+    """Turn off fsyncs for test connections.
+
+    An in-memory database only accepts MEMORY or OFF as journal mode; MEMORY
+    is kept because TestCase relies on ROLLBACK, which is undefined with OFF.
+    """
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+
+
+connection_created.connect(_disable_sqlite_durability)
@@ -0,0 +1 @@
+# Integration tests
\ No newline at end of file
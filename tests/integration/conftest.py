@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures for the integration setup tests.
+"""
+import os
+
+import pytest
+
+
+def _ensure_django():
+    """Set up Django unless the app registry is already populated."""
+    from django.apps import apps
+    if not apps.ready:
+        import django
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
+        django.setup()
+
+
+@pytest.fixture(scope='session')
+def django_env():
+    """Bootstrap Django once for the whole test session."""
+    _ensure_django()
+
+
+@pytest.fixture(scope='session')
+def admin_registry(django_env):
+    """Admin model registry, populated once for the session."""
+    from django.contrib import admin
+    admin.autodiscover()
+    return admin.site._registry
+
+
+@pytest.fixture(scope='session')
+def urls(django_env):
+    """Integration URLs reversed together while the resolver is warm."""
+    from django.urls import reverse
+    return {
+        name: reverse(name)
+        for name in (
+            'jira:dashboard', 'jira:organizations',
+            'sentry:dashboard', 'sentry:organizations',
+            'sonarcloud:dashboard', 'sonarcloud:organizations',
+        )
+    }
+
+
+@pytest.fixture(scope='session')
+def jira_client(django_env):
+    """JIRA API client shared across the session."""
+    from apps.jira.client import JiraAPIClient
+    return JiraAPIClient(
+        base_url="https://test.atlassian.net",
+        username="test@example.com",
+        api_token="dummy-token"
+    )
+
+
+@pytest.fixture(scope='session')
+def sentry_client(django_env):
+    """Sentry API client shared across the session."""
+    from apps.sentry.client import SentryAPIClient
+    return SentryAPIClient("dummy-token")
+
+
+@pytest.fixture(scope='session')
+def sonar_client(django_env):
+    """SonarCloud API client shared across the session."""
+    from apps.sonarcloud.client import SonarCloudAPIClient
+    return SonarCloudAPIClient(api_token="dummy-token")
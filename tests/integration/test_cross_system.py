@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+"""
+Tests verifying the SonarCloud Phase 2 - Cross-System Integration
+"""
+
+import functools
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+pytestmark = pytest.mark.usefixtures('django_env')
+
+_EXPECTED_HEALTH = frozenset(('overall_score', 'sentry_health', 'sonarcloud_health', 'jira_health'))
+
+
+@functools.lru_cache(maxsize=None)
+def _sentry_models():
+    from apps.sentry import models
+    return models
+
+
+@functools.lru_cache(maxsize=None)
+def _sonar_models():
+    from apps.sonarcloud import models
+    return models
+
+
+@functools.lru_cache(maxsize=None)
+def _product_models():
+    from apps.products import models
+    return models
+
+
+@pytest.fixture(scope='module')
+def sentry_quality_service(django_env):
+    from apps.sonarcloud.services_integration import SentryQualityService
+    return SentryQualityService()
+
+
+@pytest.fixture(scope='module')
+def jira_quality_service(django_env):
+    from apps.sonarcloud.services_integration import JiraQualityService
+    return JiraQualityService()
+
+
+@pytest.fixture(scope='module')
+def product_quality_service(django_env):
+    from apps.sonarcloud.services_integration import ProductQualityService
+    return ProductQualityService()
+
+
+@pytest.fixture(scope='module')
+def mock_issue(django_env):
+    """Security issue stand-in built once; tests override its message"""
+    sonarcloud_models = _sonar_models()
+    CodeIssue = sonarcloud_models.CodeIssue
+    issue = MagicMock(spec=CodeIssue)
+    issue.message = "Test security vulnerability"
+    issue.type = CodeIssue.IssueType.VULNERABILITY
+    issue.severity = CodeIssue.Severity.MAJOR
+    issue.get_type_display.return_value = CodeIssue.IssueType.VULNERABILITY.label
+    issue.get_severity_display.return_value = CodeIssue.Severity.MAJOR.label
+    issue.rule = "javascript:S2068"
+    issue.component = "src/auth/auth.js"
+    issue.line = 42
+    issue.effort = None
+    issue.project.name = "Test Project"
+    issue.project.sonarcloud_url = sonarcloud_models.sonarcloud_project_url("test-project")
+    return issue
+
+
+def test_cross_system_models():
+    """Test that cross-system integration models work"""
+    sonarcloud_models = _sonar_models()
+    for name in ('SentrySonarLink', 'JiraSonarLink', 'QualityIssueTicket'):
+        assert hasattr(sonarcloud_models, name), f"Missing model: {name}"
+
+
+def test_integration_services(sentry_quality_service, jira_quality_service, product_quality_service):
+    """Test integration services"""
+    assert sentry_quality_service is not None
+    assert jira_quality_service is not None
+    assert product_quality_service is not None
+
+
+def test_quality_context(sentry_quality_service, monkeypatch):
+    """Test quality context for Sentry projects"""
+    SentryProject = _sentry_models().SentryProject
+    SentrySonarLink = _sonar_models().SentrySonarLink
+    
+    # Structure only: stub the link lookup instead of reading the database
+    links = MagicMock()
+    links.values.return_value.first.return_value = None
+    monkeypatch.setattr(SentrySonarLink.objects, 'filter', lambda **kwargs: links)
+    
+    context = sentry_quality_service.get_quality_context_for_release(SentryProject(pk=1, slug='test'))
+    
+    # Should return valid context structure
+    assert context == {'has_quality_data': False}
+
+
+def test_product_health_calculation(product_quality_service, monkeypatch):
+    """Test unified product health scoring"""
+    Product = _product_models().Product
+    
+    # Structure only: stub every database-backed part of the calculation
+    sonarcloud_projects = MagicMock()
+    sonarcloud_projects.aggregate.return_value = {'latest': None}
+    monkeypatch.setattr(Product, 'sonarcloud_projects', sonarcloud_projects)
+    for system in ('sentry', 'sonarcloud', 'jira'):
+        monkeypatch.setattr(
+            product_quality_service, f'_calculate_{system}_health',
+            lambda product: {'score': 100, 'status': 'no_data'}
+        )
+    
+    health = product_quality_service.calculate_product_health_score(Product(pk=1, name='Test'))
+    
+    # Should return valid health structure
+    missing = _EXPECTED_HEALTH - health.keys()
+    assert not missing, f"Missing keys: {sorted(missing)}"
+
+
+@pytest.mark.parametrize('message', [
+    "Test security vulnerability",
+    "Hard-coded credentials found in authentication module",
+])
+def test_jira_ticket_creation(jira_quality_service, mock_issue, message):
+    """Test JIRA ticket creation from quality issues"""
+    mock_issue.message = message
+    
+    # Test ticket summary/description builders
+    summary = jira_quality_service._build_ticket_summary(mock_issue)
+    description = jira_quality_service._build_ticket_description(mock_issue)
+    
+    assert summary.startswith('[Security]')
+    assert message in description
+
+
+def test_admin_integration(admin_registry):
+    """Test that admin interfaces include cross-system models"""
+    sonarcloud_models = _sonar_models()
+    SentrySonarLink, JiraSonarLink, QualityIssueTicket = (
+        sonarcloud_models.SentrySonarLink, sonarcloud_models.JiraSonarLink,
+        sonarcloud_models.QualityIssueTicket
+    )
+    
+    from django.test import RequestFactory
+
+    request = RequestFactory().get('/')
+
+    # Check that cross-system models are registered and join their FKs in the changelist
+    for model in [SentrySonarLink, JiraSonarLink, QualityIssueTicket]:
+        assert model in admin_registry, f"{model.__name__} is not registered in admin"
+        model_admin = admin_registry[model]
+        assert model_admin.list_select_related or model_admin.get_queryset(request).query.select_related, \
+            f"{model.__name__} admin does not use select_related"
+
+
+def test_sentry_quality_display():
+    """Test that Sentry admin shows quality context"""
+    from apps.sentry.admin import SentryIssueAdmin
+    SentryIssue = _sentry_models().SentryIssue
+    
+    # Check that quality_context method exists
+    admin_instance = SentryIssueAdmin(SentryIssue, None)
+    assert hasattr(admin_instance, 'quality_context')
+
+
+@pytest.mark.django_db
+def test_database_migrations():
+    """Test that database migrations were applied"""
+    from django.db import connection
+    sonarcloud_models = _sonar_models()
+    
+    # One catalog lookup instead of counting rows in each table
+    with connection.cursor() as cursor:
+        tables = set(connection.introspection.table_names(cursor))
+    
+    for model in (
+        sonarcloud_models.SentrySonarLink,
+        sonarcloud_models.JiraSonarLink,
+        sonarcloud_models.QualityIssueTicket,
+    ):
+        assert model._meta.db_table in tables, f"Missing table: {model._meta.db_table}"
+
+
+# Printed once after a successful standalone run
+_EPILOGUE = """\
+🎉 All tests passed! Phase 2 Cross-System Integration is ready!
+
+📋 What you can do now:
+1. 🔗 Create Sentry-SonarCloud links:
+   - Go to /admin/sonarcloud/sentrysonarlink/add/
+   - Link projects for quality gates on releases
+
+2. 🎫 Create JIRA-SonarCloud links:
+   - Go to /admin/sonarcloud/jirasonarlink/add/
+   - Enable automated ticket creation for quality issues
+
+3. 📊 View unified product health:
+   - Products admin now shows all three systems
+   - Quality context appears in Sentry issues
+
+4. ⚡ Test automation:
+   - Use 'Process automated ticket creation' action in JIRA-SonarCloud links
+   - Check quality gates before Sentry releases
+
+🚀 Ready for Phase 3: Advanced Automation & Analytics!
+"""
+
+
+if __name__ == '__main__':
+    exit_code = pytest.main(['-q', __file__])
+    if exit_code == 0:
+        sys.stdout.write(_EPILOGUE)
+    sys.exit(exit_code)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Tests verifying the Sentry Management System setup
+"""
+
+import functools
+import importlib.util
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.usefixtures('django_env')
+
+
+@functools.lru_cache(maxsize=None)
+def _sentry_models():
+    from apps.sentry import models
+    return models
+
+
+def test_models():
+    """Test that all models can be imported and basic operations work"""
+    sentry_models = _sentry_models()
+    for name in ('SentryOrganization', 'SentryProject', 'SentryIssue', 'SentryEvent', 'SentrySyncLog'):
+        assert hasattr(sentry_models, name), f"Missing model: {name}"
+    SentryOrganization = sentry_models.SentryOrganization
+    
+    # Test model creation (without saving)
+    org = SentryOrganization(
+        sentry_id="test",
+        slug="test-org",
+        name="Test Organization",
+        api_token="test-token"
+    )
+    assert org.slug == "test-org"
+
+
+def test_client(sentry_client):
+    """Test that the Sentry client can be instantiated"""
+    assert sentry_client is not None
+
+
+def test_services():
+    """Test that services can be imported"""
+    from apps.sentry.services import SentrySyncService, sync_all_organizations
+
+
+def test_admin(admin_registry):
+    """Test that admin interface is properly configured"""
+    SentryOrganization = _sentry_models().SentryOrganization
+    
+    assert SentryOrganization in admin_registry, "Admin configuration not found"
+
+
+def test_urls(urls):
+    """Test that URLs can be resolved"""
+    # Test main dashboard URL
+    assert urls['sentry:dashboard']
+    assert urls['sentry:organizations']
+
+
+def test_management_command():
+    """Test that management command exists"""
+    spec = importlib.util.find_spec('apps.sentry.management.commands.sync_sentry')
+    assert spec is not None, "Management command 'sync_sentry' not found"
+
+
+# Printed once after a successful standalone run
+_EPILOGUE = """\
+🎉 All tests passed! Your Sentry Management System is ready to use.
+
+📋 Next steps:
+1. Start the server: python manage.py runserver
+2. Go to http://localhost:8000/admin/sentry/sentryorganization/add/
+3. Add your Sentry organization with API token
+4. Visit http://localhost:8000/sentry/ to see the dashboard
+"""
+
+
+if __name__ == '__main__':
+    exit_code = pytest.main(['-q', __file__])
+    if exit_code == 0:
+        sys.stdout.write(_EPILOGUE)
+    sys.exit(exit_code)